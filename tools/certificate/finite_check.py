@@ -4,6 +4,11 @@ import argparse
 import json
 from pathlib import Path
 
+try:
+    from .step_table import StepTable  # type: ignore
+except ImportError:  # pragma: no cover
+    from step_table import StepTable  # type: ignore
+
 
 def collatz_reaches_one(n: int, max_steps: int = 1_000_000) -> int:
     """Return steps needed for n to reach 1 under the original Collatz map."""
@@ -36,6 +41,12 @@ def main() -> None:
     parser = argparse.ArgumentParser(description="Finite verification for n ≤ N0*.")
     parser.add_argument("--summary", type=Path, default=Path("artifacts/summary.json"))
     parser.add_argument("--verified-bound", type=int, default=None)
+    parser.add_argument(
+        "--table",
+        type=Path,
+        default=None,
+        help="Persistent step-count table; extended only beyond its recorded watermark.",
+    )
     parser.add_argument("--log", type=Path, default=Path("artifacts/finite-check.log"))
     args = parser.parse_args()
 
@@ -45,12 +56,31 @@ def main() -> None:
     N0_star = int(data["N0_star"])
     log_lines: list[str] = []
 
-    if args.verified_bound is not None and args.verified_bound >= N0_star:
+    table = StepTable(args.table) if args.table is not None else None
+
+    if table is not None and table.watermark >= N0_star:
+        log_lines.append(
+            f"Step table {args.table} records all n ≤ {table.watermark}, "
+            f"and N0*={N0_star} lies below this threshold."
+        )
+        log_lines.append(
+            f"Recorded max steps {table.max_steps} over n ≤ {table.watermark} "
+            f"attained at n={table.argmax}."
+        )
+    elif args.verified_bound is not None and args.verified_bound >= N0_star:
         log_lines.append(
             f"Verified bound shortcut: known computations cover all n ≤ {args.verified_bound}, "
             f"and N0*={N0_star} lies below this threshold."
         )
         log_lines.append("No additional simulation was required.")
+    elif table is not None:
+        log_lines.append(
+            f"Extending step table {args.table} from n ≤ {table.watermark} to n ≤ {N0_star} ..."
+        )
+        table.extend(N0_star)
+        log_lines.append(
+            f"Simulation complete. Max steps {table.max_steps} attained at n={table.argmax}."
+        )
     else:
         log_lines.append(f"Simulating Collatz for all n ≤ {N0_star} ...")
         max_steps, argmax = simulate_range(N0_star)
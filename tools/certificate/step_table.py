@@ -0,0 +1,99 @@
+from __future__ import annotations
+
+import mmap
+import struct
+import sys
+from pathlib import Path
+
+MAGIC = b"CLZSTEP1"
+HEADER = struct.Struct("<8sQQQ")
+ENTRY_SIZE = 2
+MAX_ENTRY = (1 << (8 * ENTRY_SIZE)) - 1
+
+
+class StepTable:
+    """Memory-mapped table of Collatz step counts for every n up to a watermark.
+
+    The file holds a fixed header (magic, watermark, max_steps, argmax) followed
+    by one unsigned 16-bit step count per n, indexed from n=0.  The header is
+    rewritten only after the entries it covers have been flushed, so an
+    interrupted extension leaves the previous watermark intact.
+    """
+
+    def __init__(self, path: Path) -> None:
+        if sys.byteorder != "little":
+            raise RuntimeError("Step tables are stored little-endian; unsupported host byte order")
+        self.path = path
+        self.watermark = 1
+        self.max_steps = 0
+        self.argmax = 1
+        if path.exists():
+            with path.open("rb") as handle:
+                header = handle.read(HEADER.size)
+            if len(header) != HEADER.size:
+                raise ValueError(f"Truncated step table header: {path}")
+            magic, self.watermark, self.max_steps, self.argmax = HEADER.unpack(header)
+            if magic != MAGIC:
+                raise ValueError(f"Not a step table: {path}")
+        else:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            with path.open("wb") as handle:
+                handle.write(self._header())
+                handle.write(bytes(ENTRY_SIZE * (self.watermark + 1)))
+        expected = HEADER.size + ENTRY_SIZE * (self.watermark + 1)
+        if path.stat().st_size < expected:
+            raise ValueError(f"Step table {path} is shorter than its watermark {self.watermark}")
+
+    def _header(self) -> bytes:
+        return HEADER.pack(MAGIC, self.watermark, self.max_steps, self.argmax)
+
+    def extend(self, limit: int, max_steps: int = 1_000_000) -> None:
+        """Record step counts for all n in (watermark, limit], reusing stored entries.
+
+        Each new n is iterated only until its trajectory first drops below n,
+        at which point the remaining count is read from the table.
+        """
+        if limit <= self.watermark:
+            return
+        size = HEADER.size + ENTRY_SIZE * (limit + 1)
+        with self.path.open("r+b") as handle:
+            handle.truncate(size)
+            with mmap.mmap(handle.fileno(), size) as mapped:
+                steps_by_n = memoryview(mapped)[HEADER.size:].cast("H")
+                try:
+                    best_steps = self.max_steps
+                    best_n = self.argmax
+                    for n in range(self.watermark + 1, limit + 1):
+                        steps = 0
+                        value = n
+                        while value >= n:
+                            if steps > max_steps:
+                                raise RuntimeError(f"Exceeded max steps for n={n}")
+                            if value % 2 == 0:
+                                value //= 2
+                            else:
+                                value = 3 * value + 1
+                            steps += 1
+                        steps += steps_by_n[value]
+                        if steps > MAX_ENTRY:
+                            raise OverflowError(f"Step count {steps} for n={n} does not fit the table")
+                        steps_by_n[n] = steps
+                        if steps > best_steps:
+                            best_steps = steps
+                            best_n = n
+                finally:
+                    steps_by_n.release()
+                mapped.flush()
+                self.watermark = limit
+                self.max_steps = best_steps
+                self.argmax = best_n
+                mapped[: HEADER.size] = self._header()
+                mapped.flush()
+
+    def steps(self, n: int) -> int:
+        """Return the stored step count for n, which must lie within the watermark."""
+        if not 1 <= n <= self.watermark:
+            raise IndexError(f"n={n} outside recorded range [1, {self.watermark}]")
+        with self.path.open("rb") as handle:
+            handle.seek(HEADER.size + ENTRY_SIZE * n)
+            return int.from_bytes(handle.read(ENTRY_SIZE), "little")